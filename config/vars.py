@@ -23,6 +23,9 @@ VERSION = "3.5.9" # Application Version
 # API Base URL for the application
 API_BASE_URL='https://nxgfwt5dei.execute-api.ca-central-1.amazonaws.com'
 
+# Verbose scanner debug output (per batch and per room messages), enabled with FRANKTORIO_SCANNER_DEBUG=1
+SCANNER_DEBUG: bool = os.environ.get("FRANKTORIO_SCANNER_DEBUG") == "1"
+
 # User log file path from configuration
 USER_LOG_PATH: str = appdata.get_value_from_config('set_log_path', '')
 
@@ -3,6 +3,8 @@
 # December 2025
 
 import sys
+import asyncio
+import qasync
 from PyQt5.QtCore import QSharedMemory, Qt
 from src.app.gui import MainWindow
 from PyQt5.QtWidgets import QApplication
@@ -29,6 +31,10 @@ app = QApplication(sys.argv)
 app.setApplicationName("Franktorio Research Scanner")
 app.setApplicationDisplayName("Franktorio Research Scanner")
 
+# Run asyncio on top of the Qt event loop so coroutines share the GUI thread
+loop = qasync.QEventLoop(app)
+asyncio.set_event_loop(loop)
+
 # Single-instance enforcement
 shared_memory = QSharedMemory("FranktorioScannerInstance")
 if not shared_memory.create(1):
@@ -52,7 +58,11 @@ app.setWindowIcon(app_icon)
 log_directory = get_value_from_config("set_log_path", "Automatic Detection")
 window.log_console_message.emit(f"Log directory from config: {log_directory}")
 
+app_close_event = asyncio.Event()
+app.aboutToQuit.connect(app_close_event.set)
+
 try:
-    sys.exit(app.exec_())
+    with loop:
+        loop.run_until_complete(app_close_event.wait())
 except Exception as e:
     print(f"An error occurred: {e}")
\ No newline at end of file
@@ -20,10 +20,6 @@ class RoomInfo:
         self.doc_by_user_id: int = kwargs.get("doc_by_user_id", -1)
         self.edits: list[dict] = kwargs.get("edits", []) # List of edit records, not used
 
-def _run_in_executor(func, *args, **kwargs):
-    loop = asyncio.get_running_loop()
-    return loop.run_in_executor(None, func, *args, **kwargs)
-
 def _submit_bug_report(report_text: str, debug_console_text: str, main_console_text: str) -> bool:
     """Submit a bug report to the API"""
     max_retries = 3
@@ -208,27 +204,27 @@ def _log_room_encounter(room_name: str) -> bool:
     
 async def request_session() -> bool:
     """Asynchronously request a new session from the API"""
-    return await _run_in_executor(_request_session)
+    return await asyncio.to_thread(_request_session)
 
 async def end_session() -> bool:
     """Asynchronously end the current session"""
-    return await _run_in_executor(_end_session)
+    return await asyncio.to_thread(_end_session)
 
 async def room_encountered(room_name: str, log_event: bool) -> tuple[bool, RoomInfo | None]:
     """Asynchronously get room info and log the encounter"""
-    # Get coroutines to run in executor
+    # Get coroutines to run in worker threads
     if log_event:
-        logged_task =  _run_in_executor(_log_room_encounter, room_name)
-        room_info_task =  _run_in_executor(_get_room_info, room_name)
+        logged_task =  asyncio.to_thread(_log_room_encounter, room_name)
+        room_info_task =  asyncio.to_thread(_get_room_info, room_name)
 
         # Run both tasks concurrently
         logged, room_info = await asyncio.gather(logged_task, room_info_task)
     else:
-        room_info = await _run_in_executor(_get_room_info, room_name)
+        room_info = await asyncio.to_thread(_get_room_info, room_name)
         logged = False
     
     return logged, room_info
     
 async def check_scanner_version() -> str:
     """Asynchronously check if the scanner version is up to date"""
-    return await _run_in_executor(_check_scanner_version)
\ No newline at end of file
+    return await asyncio.to_thread(_check_scanner_version)
\ No newline at end of file
@@ -110,6 +110,7 @@ class BugReportWindow(QMainWindow):
         debug_console_text = ""
 
         if hasattr(self.parent(), 'console_text_area'):
+            self.parent().flush_log_buffer()  # Include lines still waiting for the batched append
             main_console_text = self.parent().console_text_area.toPlainText()
         
         if hasattr(self.parent(), 'debug_console_window'):
@@ -5,7 +5,7 @@
 import datetime
 
 from PyQt5.QtWidgets import QMainWindow, QTextEdit, QPushButton
-from PyQt5.QtCore import pyqtSignal
+from PyQt5.QtCore import pyqtSignal, pyqtSlot
 
 from config.vars import VERSION
 from .colors import COLORS, convert_style_to_qss
@@ -117,6 +117,7 @@ class DebugConsoleWindow(QMainWindow):
         self.debug_text_area.append("=" * 80)
         self.debug_text_area.append("")
 
+    @pyqtSlot(str)
     def log_debug_message(self, message: str):
         """Log a debug message to the debug console."""
         MAX_CHARS = 50000
@@ -126,6 +127,7 @@ class DebugConsoleWindow(QMainWindow):
         self.debug_text_area.setText(current_text[-MAX_CHARS:] + formatted_message + "\n")
         self.debug_text_area.verticalScrollBar().setValue(self.debug_text_area.verticalScrollBar().maximum())
 
+    @pyqtSlot()
     def open_bug_report_window(self):
         """Open the bug report window."""
         # Get parent's bug report window
@@ -153,6 +155,7 @@ class DebugConsoleWindow(QMainWindow):
         self.debug_text_area.append(f"  Total Reads:            {stats.get('stalker_reads', 0)}")
         self.debug_text_area.append(f"  Total Lines Read:       {stats.get('stalker_lines_read', 0)}")
         self.debug_text_area.append(f"  Empty Reads:            {stats.get('stalker_empty_reads', 0)}")
+        self.debug_text_area.append(f"  Avg Read Time:          {stats.get('stalker_avg_read_us', 0):.1f} us")
         
         # Parser stats
         self.debug_text_area.append("\n[Parser Statistics]")
@@ -2,8 +2,10 @@
 # Sync Window
 # December 2025
 
+import asyncio
+
 from PyQt5.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QApplication, QMenu, QSlider, QWidgetAction
-from PyQt5.QtCore import Qt, QEvent
+from PyQt5.QtCore import Qt, QEvent, pyqtSlot
 from PyQt5.QtGui import QPixmap, QFont
 
 from .colors import COLORS, convert_style_to_qss
@@ -28,6 +30,8 @@ class SyncWindow(QMainWindow):
         self.dragging = False
         self.drag_position = None
         
+        self._image_tasks = set()  # In-flight room image fetches, cancelled when the session is cleared
+        
         from src.app.user_data.appdata import get_value_from_config
         self.persistent_window = get_value_from_config("sync_window_persistent", True)
         
@@ -571,6 +575,7 @@ class SyncWindow(QMainWindow):
             else:
                 widget.image_label.setText("No Image")
     
+    @pyqtSlot(str)
     def add_player(self, username: str):
         """Add a player to tracking."""
         if not hasattr(self, 'players'):
@@ -580,12 +585,14 @@ class SyncWindow(QMainWindow):
             self.players[username] = {"current_room": None}
             self._update_display()
     
+    @pyqtSlot(str)
     def remove_player(self, username: str):
         """Remove a player from tracking."""
         if hasattr(self, 'players') and username in self.players:
             del self.players[username]
             self._update_display()
     
+    @pyqtSlot(str, str)
     def change_player_room(self, username: str, room_name: str):
         """Change a player's current room."""
         if not hasattr(self, 'players'):
@@ -597,11 +604,9 @@ class SyncWindow(QMainWindow):
         self.players[username]["current_room"] = room_name
         self._update_display()
     
+    @pyqtSlot(str)
     def new_room_encounter(self, room_name: str):
         """Add a new room encounter."""
-        from src.api.images import download_image
-        from src.api.scanner import _get_room_info
-        
         if not hasattr(self, 'encountered_rooms'):
             self.encountered_rooms = []
 
@@ -614,18 +619,29 @@ class SyncWindow(QMainWindow):
                 self.encountered_rooms = self.encountered_rooms[:6]  # Keep only 6 most recent
             
             self._update_display()  # Update display before downloading
-            QApplication.processEvents()  # Update UI
             
-            # Get room info and download first image
-            room_info = _get_room_info(room_name)
+            # Fetch the image off the event loop so the websocket and GUI stay responsive
+            task = asyncio.ensure_future(self._fetch_room_image(room_name))
+            self._image_tasks.add(task)  # Keep a reference so the task isn't garbage collected mid-fetch
+            task.add_done_callback(self._image_tasks.discard)
+    
+    async def _fetch_room_image(self, room_name: str):
+        """Get room info and download the first image of a room in worker threads."""
+        from src.api.images import download_image
+        from src.api.scanner import _get_room_info
+        
+        try:
+            room_info = await asyncio.to_thread(_get_room_info, room_name)
             if room_info and room_info.picture_urls:
-                image_data = download_image(room_info.picture_urls[0])
+                image_data = await asyncio.to_thread(download_image, room_info.picture_urls[0])
                 self.image_map[room_name] = image_data
             else:
                 self.image_map[room_name] = None
-            
-            self._update_display()  # Update again after image download
-            QApplication.processEvents()  # Update UI
+        except Exception as e:
+            print(f"Error fetching image for room {room_name}: {e}")
+            self.image_map[room_name] = None
+        
+        self._update_display()  # Update again after image download
     
     def _update_display(self):
         """Update the display with current room and player data."""
@@ -667,6 +683,9 @@ class SyncWindow(QMainWindow):
     
     def clear_all(self):
         """Clear all players and rooms."""
+        for task in list(self._image_tasks):
+            task.cancel()  # Fetches from the ended session must not repopulate the display
+        self._image_tasks.clear()
         self.players = {}
         self.encountered_rooms = []
         self._update_display()
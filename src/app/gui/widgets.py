@@ -2,10 +2,8 @@
 # Widget Setup Methods
 # December 2025
 
-import threading
-
-from PyQt5.QtWidgets import QWidget, QLabel, QPushButton, QHBoxLayout, QVBoxLayout, QTextEdit, QMenu, QSlider, QWidgetAction
-from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import QWidget, QLabel, QPushButton, QHBoxLayout, QVBoxLayout, QPlainTextEdit, QMenu, QSlider, QWidgetAction
+from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtGui import QFont, QPixmap, QFontMetrics
 from PyQt5.QtWidgets import QApplication
 
@@ -58,21 +56,12 @@ class WidgetSetupMixin:
         # Image label uses 85% of vertical space at top (reduced from 90% to make room for button)
         image_height = int(widget_height * 0.85)
         self.display_image_label.setGeometry(0, 0, widget_width, image_height)
+        self._display_w = widget_width
+        self._display_h = image_height
         
-        # Update displayed image if any
-        if hasattr(self, 'loaded_images') and self.loaded_images:
-            current_image = self.loaded_images[self.current_image_index]
-            if current_image:
-                pixmap = QPixmap()
-                pixmap.loadFromData(current_image)
-                # Use KeepAspectRatioByExpanding to fill space and crop if needed
-                scaled_pixmap = pixmap.scaled(
-                    self.display_image_label.width(),
-                    self.display_image_label.height(),
-                    Qt.KeepAspectRatioByExpanding,
-                    Qt.SmoothTransformation
-                )
-                self.display_image_label.setPixmap(scaled_pixmap)
+        # Update displayed image if any (re-decoded at the new size)
+        if hasattr(self, 'loaded_images') and self.current_image_index < len(self.loaded_images):
+            self._display_loaded_image(self.current_image_index)
         
         # Bottom area for controls (remaining 15%)
         button_area_top = image_height
@@ -521,7 +510,6 @@ class WidgetSetupMixin:
         title_layout.addWidget(self.minimize_button)
         
         self.close_button = QPushButton("X", self.title_bar)
-        self.close_button.clicked.connect(self.close)
         self.close_button.setFixedSize(int(20 * self.dpi_scale), int(20 * self.dpi_scale))
         self.close_button.setObjectName("closeButton")
         title_layout.addWidget(self.close_button)
@@ -593,9 +581,13 @@ class WidgetSetupMixin:
         # Add 1 big image label to cycle through images like a slideshow
         self.current_image_index = 0
         self.loaded_images = []
+        self.loaded_image_data = []
 
         self.display_image_label = QLabel("No image to display...", self.images_widget)
         self.display_image_label.setAlignment(Qt.AlignCenter)
+        # Cached label size, only updated when the image widget is laid out
+        self._display_w = self.display_image_label.width()
+        self._display_h = self.display_image_label.height()
 
         # Add image counter label
         font = QFont("Segoe UI", int(11 * self.dpi_scale))
@@ -715,12 +707,11 @@ class WidgetSetupMixin:
 
         def _reset_button_text():
             """Reset button text after a delay"""
-            threading.Event().wait(1.5)
             self.copy_room_name_button.setEnabled(True)
             self.copy_room_name_button.setText("Copy Room Name")
 
-        # Make a small thread to change button text temporarily
-        threading.Thread(target=_reset_button_text, daemon=True).start()
+        # Change button text back on the GUI thread after a short delay
+        QTimer.singleShot(1500, _reset_button_text)
 
 
     def setup_server_information_widget(self):
@@ -785,7 +776,7 @@ class WidgetSetupMixin:
                     "border": f"1px solid {COLORS['border']}",
                     "border-radius": "10px"
                 },
-                "#mainConsoleWidget QTextEdit": {
+                "#mainConsoleWidget QPlainTextEdit": {
                     "background-color": COLORS['surface'],
                     "color": COLORS['text'],
                     "padding": "1px",
@@ -830,10 +821,11 @@ class WidgetSetupMixin:
         font = QFont("Segoe UI", int(10 * self.dpi_scale))
 
         # Setup console text area
-        self.console_text_area = QTextEdit(f"Scanner version: {VERSION}", self.main_console_widget)
+        self.console_text_area = QPlainTextEdit(f"Scanner version: {VERSION}", self.main_console_widget)
         self.console_text_area.setFont(font)
-        self.console_text_area.setAlignment(Qt.AlignTop | Qt.AlignLeft)
         self.console_text_area.setReadOnly(True)
+        self.console_text_area.setUndoRedoEnabled(False)
+        self.console_text_area.setMaximumBlockCount(200)  # Oldest lines are dropped past this
 
         # Create console control buttons
         self.clear_console_button = QPushButton("Clear", self.main_console_widget)
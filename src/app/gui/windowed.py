@@ -2,18 +2,18 @@
 # Main Window Builder with Overlay/Windowed Mode Support
 # February 2026
 
-import datetime
-from email.mime import application
-import threading
 import time
+from email.mime import application
 import asyncio
 import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QFileDialog, QShortcut, QInputDialog
 )
-from PyQt5.QtCore import Qt, pyqtSignal, QSize, QPropertyAnimation, QEasingCurve
-from PyQt5.QtGui import QPixmap, QKeySequence, QMovie
+from PyQt5.QtCore import Qt, pyqtSignal, pyqtSlot, QSize, QPropertyAnimation, QEasingCurve, QTimer, QBuffer, QByteArray
+from PyQt5.QtGui import QPixmap, QImage, QImageReader, QKeySequence, QMovie
 
 from config.vars import MIN_WIDTH, MIN_HEIGHT, VERSION, LOADING_GIF_PATH
 from .colors import COLORS, convert_style_to_qss
@@ -29,6 +29,46 @@ from src.api.images import download_image
 
 from src.app.user_data.appdata import set_value_in_config, get_value_from_config
 
+def _decode_scaled_image(image_data: bytes | None, width: int, height: int) -> QImage:
+    """
+    Decode image bytes and scale them to fill the given size.
+    Uses QImage rather than QPixmap so it is safe to call off the GUI thread.
+    The reader is given the target size so JPEGs are downscaled while decoding.
+    """
+    if not image_data:
+        return QImage()
+    
+    buffer = QBuffer()
+    buffer.setData(QByteArray(image_data))
+    reader = QImageReader(buffer)
+    size = reader.size()
+    if size.isValid() and width > 0 and height > 0:
+        size.scale(width, height, Qt.KeepAspectRatioByExpanding)
+        reader.setScaledSize(size)
+        image = reader.read()
+        if not image.isNull():
+            return image
+    
+    # Fall back to a full decode for formats that do not report their size up front
+    image = QImage.fromData(image_data)
+    if image.isNull():
+        return image
+    return image.scaled(width, height, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
+
+# (second, formatted timestamp) of the last console line, so bursts within a second format once
+_timestamp_cache = [0, ""]
+
+def _console_timestamp() -> str:
+    """Get the console timestamp for the current second, formatting it only when the second changes"""
+    now = int(time.time())
+    if now != _timestamp_cache[0]:
+        _timestamp_cache[:] = (now, time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(now)))
+    return _timestamp_cache[1]
+
+def _image_fills_size(image: QImage, width: int, height: int) -> bool:
+    """Check if an image is already scaled to fill the given size (one side matches, the other overflows)"""
+    return (image.width() == width and image.height() >= height) or (image.height() == height and image.width() >= width)
+
 class MainWindow(WindowControlsMixin, WidgetSetupMixin, QMainWindow):
     # Define signals
     server_info_updated = pyqtSignal(dict)  # Signal to update server info widget with dictionary
@@ -39,7 +79,7 @@ class MainWindow(WindowControlsMixin, WidgetSetupMixin, QMainWindow):
     version_check_ready = pyqtSignal(str)  # Signal when version check completes with latest version
     forward_image_requested = pyqtSignal()  # Signal to request forward image
     backward_image_requested = pyqtSignal()  # Signal to request backward image
-    images_loaded = pyqtSignal(list, list, str)  # Signal when images are loaded (image_data_list, picture_urls, room_name)
+    single_image_ready = pyqtSignal(int, bytes, QImage, str)  # Signal when one room image is ready (index, image_data, decoded_image, room_name)
     
     # Websocket signals for sync functionality
     ws_add_player = pyqtSignal(str)  # Signal to add player to sync window
@@ -94,6 +134,18 @@ class MainWindow(WindowControlsMixin, WidgetSetupMixin, QMainWindow):
         self.setup_server_information_widget()
         self.setup_main_console_widget()
 
+        # Loading animation, decoded once and reused for every image that is still downloading
+        self.loading_movie = QMovie(LOADING_GIF_PATH)
+        self.loading_movie.setScaledSize(QSize(50, 50))
+        self.loading_movie.setCacheMode(QMovie.CacheAll)
+
+        # Console lines are buffered and written in batches by a short single-shot timer
+        self._log_buffer = deque(maxlen=200)
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(100)
+        self._log_timer.timeout.connect(self.flush_log_buffer)
+
         self.server_info_updated.connect(self.on_server_info_updated)
         self.room_info_updated.connect(self.on_room_info_updated)
         self.update_start_scan_button_state.connect(self.on_update_start_scan_button_state)
@@ -113,20 +165,21 @@ class MainWindow(WindowControlsMixin, WidgetSetupMixin, QMainWindow):
         self.sync_window.hide()  # Hidden by default until user starts syncing
         
         # Websocket tracking
-        self.websocket_thread = None
-        self.websocket_loop = None
         self.websocket_task = None
         self.is_syncing = False
 
+        # Shared worker pool for room image downloads
+        self._dl_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="img-dl")
+
         # Scanner object placeholder
         self.scanner = Scanner()
         self.setup_scanner()
+        # Version check runs as a task on the Qt event loop, its request goes to a worker thread
+        self.version_check_task = asyncio.ensure_future(self.scanner.version_check_loop())
         self.setup_rotating_images()
         
         if hasattr(self, 'sync_action'):
             self.sync_action.triggered.connect(self.on_sync_button_clicked)
-        if hasattr(self, 'persistent_action'):
-            self.persistent_action.triggered.connect(self.on_persistent_window_button_toggled)
         
         saved_opacity = get_value_from_config("main_window_opacity", 100)
         if hasattr(self, 'opacity_slider'):
@@ -179,81 +232,71 @@ class MainWindow(WindowControlsMixin, WidgetSetupMixin, QMainWindow):
             pass
         return 1.0
     
-    def _rotating_image_worker(self):
-        """Worker thread to handle rotating images every 5 seconds"""
-        while True:
-            if not self.loaded_images or not self.rotating_images_enabled:
-                time.sleep(0.5)
-                continue
-            
-            current_time = datetime.datetime.now().timestamp()
-            if current_time - self.last_image_change_time >= self.time_between_image_changes:
-                self.forward_image_requested.emit()
-                self.last_image_change_time = current_time
-    
     def _show_loading_gif(self):
         """Display the loading gif animation"""
-        self.loading_movie = QMovie(LOADING_GIF_PATH)
-        self.loading_movie.setScaledSize(QSize(50, 50))
         self.display_image_label.setMovie(self.loading_movie)
         self.loading_movie.start()
     
-    def _download_images_thread(self, picture_urls, room_name):
-        """Thread worker to download remaining images (after first)"""
-        downloaded_images = []
-        for url in picture_urls[1:]:
-            if self.current_room_name != room_name:
-                # Room changed, abort this download
+    def _download_image_worker(self, index, url, room_name, width, height):
+        """Pool worker to download and decode a single room image"""
+        if self.current_room_name != room_name:
+            # Room changed before this download started
+            return
+        image_data = download_image(url) or b""
+        image = _decode_scaled_image(image_data, width, height)
+        self.single_image_ready.emit(index, image_data, image, room_name)
+    
+    def _display_loaded_image(self, index):
+        """Display a loaded image, re-decoding it if the label was resized since it was scaled"""
+        image = self.loaded_images[index]
+        if image is None:
+            return  # Still downloading
+        
+        width, height = self._display_w, self._display_h
+        # A null image may come from a decode before the first layout (size 0), retry it from the kept bytes
+        if image.isNull() or not _image_fills_size(image, width, height):
+            image = _decode_scaled_image(self.loaded_image_data[index], width, height)
+            self.loaded_images[index] = image
+            if image.isNull():
                 return
-            image_data = download_image(url)
-            downloaded_images.append(image_data)
-        
-        # Emit signal with downloaded images and room name for validation
-        self.images_loaded.emit(downloaded_images, picture_urls, room_name)
+        self.display_image_label.setPixmap(QPixmap.fromImage(image))
     
-    def on_images_loaded(self, image_data_list, picture_urls, room_name):
-        """Slot to handle when remaining images have been downloaded"""
+    @pyqtSlot(int, bytes, QImage, str)
+    def on_single_image_ready(self, index, image_data, image, room_name):
+        """Slot to handle a room image finishing its download"""
         if self.current_room_name != room_name:
             return
         
-        self.loaded_images.extend(image_data_list)
-        
-        if self.current_image_index < len(self.loaded_images):
-            if hasattr(self, 'loading_movie') and self.loading_movie.state() == QMovie.Running:
-                self.loading_movie.stop()
-                self.display_image_label.setMovie(None)
-                current_image = self.loaded_images[self.current_image_index]
-                if current_image:
-                    pixmap = QPixmap()
-                    pixmap.loadFromData(current_image)
-                    scaled_pixmap = pixmap.scaled(
-                        self.display_image_label.width(),
-                        self.display_image_label.height(),
-                        Qt.KeepAspectRatioByExpanding,
-                        Qt.SmoothTransformation
-                    )
-                    self.display_image_label.setPixmap(scaled_pixmap)
-            
-            self.image_counter_label.setText(f"{self.current_image_index + 1}/{self.total_images_expected}")
+        self.loaded_image_data[index] = image_data
+        self.loaded_images[index] = image
+        
+        if index == self.current_image_index:
+            self.loading_movie.stop()
+            self.display_image_label.setMovie(None)
+            self._display_loaded_image(index)
     
     def setup_rotating_images(self):
         """Rotating image setup"""
         self.current_image_index = 0
-        self.loaded_images = []
+        self.loaded_images = []  # Decoded images scaled to the display label
+        self.loaded_image_data = []  # Raw image bytes, kept to re-decode after a resize
         self.total_images_expected = 0  # Track total expected images for counter
         self.time_between_image_changes = 3 # Seconds
-        self.last_image_change_time = datetime.datetime.now().timestamp()
         
         # Load saved rotating images preference
         self.rotating_images_enabled = get_value_from_config("rotating_images_enabled", False)
         self.current_room_name = None  # Track which room's images are currently being downloaded
+        self._updating_room = False  # Guards on_room_info_updated against re-entry
 
         # Update button text based on loaded preference
         if hasattr(self, 'toggle_rotating_images_button'):
             self.toggle_rotating_images_button.setText("Rotating Images: ON" if self.rotating_images_enabled else "Rotating Images: OFF")
 
-        self.rotating_image_thread = threading.Thread(target=self._rotating_image_worker, daemon=True)
-        self.rotating_image_thread.start()  # Start the thread
+        # Timer on the GUI thread that advances the slideshow while rotation is enabled
+        self._rotation_timer = QTimer(self)
+        self._rotation_timer.timeout.connect(self.on_forward_image_button_clicked)
+        if self.rotating_images_enabled:
+            self._rotation_timer.start(self.time_between_image_changes * 1000)
 
     
     def setup_scanner(self):
@@ -271,9 +314,6 @@ class MainWindow(WindowControlsMixin, WidgetSetupMixin, QMainWindow):
         self.start_scan_button.clicked.connect(self.scanner.start)
         self.stop_scan_button.clicked.connect(self.scanner.stop)
         
-        if hasattr(self, 'persistent_action'):
-            self.persistent_action.triggered.connect(self.on_persistent_window_button_toggled)
-        
         self.prev_image_button.clicked.connect(self.on_backward_image_button_clicked)
         self.next_image_button.clicked.connect(self.on_forward_image_button_clicked)
         self.toggle_rotating_images_button.clicked.connect(self.on_toggle_rotating_images_clicked)
@@ -284,7 +324,7 @@ class MainWindow(WindowControlsMixin, WidgetSetupMixin, QMainWindow):
 
         self.forward_image_requested.connect(self.on_forward_image_button_clicked)
         self.backward_image_requested.connect(self.on_backward_image_button_clicked)
-        self.images_loaded.connect(self.on_images_loaded)
+        self.single_image_ready.connect(self.on_single_image_ready)
         
         self.ws_add_player.connect(self.sync_window.add_player)
         self.ws_remove_player.connect(self.sync_window.remove_player)
@@ -310,7 +350,7 @@ class MainWindow(WindowControlsMixin, WidgetSetupMixin, QMainWindow):
             self._update_widget_sizes()
     
     def _start_websocket_sync(self, username: str, socket_name: str):
-        """Start websocket connection in a separate thread"""
+        """Start websocket connection as a task on the Qt event loop"""
         from src.api.websocket import websocket_loop, set_gui_signals
         
         set_gui_signals(
@@ -322,32 +362,27 @@ class MainWindow(WindowControlsMixin, WidgetSetupMixin, QMainWindow):
             self.ws_connection_closed
         )
         
-        def run_websocket():
-            """Run websocket loop in a separate thread"""
-            self.websocket_loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(self.websocket_loop)
-            if self.scanner:
-                current_room = self.scanner.latest_rooms[-1] if self.scanner.latest_rooms else "Unknown"
-            try:
-                self.websocket_loop.run_until_complete(websocket_loop(username, socket_name, current_room))
-            except Exception as e:
-                self.debug_console_window.debug_console_message.emit(f"[WS] Websocket thread error: {e}")
-            finally:
-                self.websocket_loop.close()
-        
-        self.websocket_thread = threading.Thread(target=run_websocket, daemon=True)
-        self.websocket_thread.start()
+        # Snapshot the current room once, before the task starts
+        current_room = self.scanner.get_latest_room() or "Unknown"
+        self.websocket_task = asyncio.ensure_future(websocket_loop(username, socket_name, current_room))
+        self.websocket_task.add_done_callback(self._on_websocket_task_done)
+    
+    def _on_websocket_task_done(self, task: asyncio.Task):
+        """Report websocket task errors to the debug console"""
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error:
+            self.debug_console_window.debug_console_message.emit(f"[WS] Websocket task error: {error}")
     
     def _stop_websocket_sync(self):
         """Stop websocket connection and reset sync window"""
-        if self.websocket_loop:
-            try:
-                self.websocket_loop.call_soon_threadsafe(self.websocket_loop.stop)
-            except:
-                pass
-        self.websocket_thread = None
+        if self.websocket_task and not self.websocket_task.done():
+            self.websocket_task.cancel()
+        self.websocket_task = None
         self.sync_window.clear_all()
     
+    @pyqtSlot()
     def on_websocket_connection_closed(self):
         """Handle websocket connection closure and reset sync state"""
         if self.is_syncing:
@@ -365,6 +400,9 @@ class MainWindow(WindowControlsMixin, WidgetSetupMixin, QMainWindow):
         if self.is_syncing:
             self._stop_websocket_sync()
         
+        # Drop queued image downloads without waiting on the ones in flight
+        self._dl_pool.shutdown(wait=False, cancel_futures=True)
+        
         geometry = self.geometry()
         window_geometry = {
             "x": geometry.x(),
@@ -375,14 +413,24 @@ class MainWindow(WindowControlsMixin, WidgetSetupMixin, QMainWindow):
         set_value_in_config("window_geometry", window_geometry)
         super().closeEvent(event)
 
+    @pyqtSlot(str)
     def on_log_console_message(self, message: str):
         """Slot to handle logging messages to console"""
-        MAX_CHARS = 5000
-        now = ""  if message == "" else f"[{datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}]"
-        formatted_message = f"{now} {message}\n"
-        self.console_text_area.setText(self.console_text_area.toPlainText()[-MAX_CHARS:] + formatted_message) # Keep last MAX_CHARS chars
+        now = ""  if message == "" else f"[{_console_timestamp()}]"
+        self._log_buffer.append(f"{now} {message}")
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    @pyqtSlot()
+    def flush_log_buffer(self):
+        """Write all buffered console lines in a single append"""
+        if not self._log_buffer:
+            return
+        self.console_text_area.appendPlainText("\n".join(self._log_buffer))
+        self._log_buffer.clear()
         self.console_text_area.verticalScrollBar().setValue(self.console_text_area.verticalScrollBar().maximum()) # Auto-scroll to bottom
 
+    @pyqtSlot(dict)
     def on_server_info_updated(self, info_dict: dict):
         """Slot to handle server info updates"""
         country = info_dict.get("country", "N/A")
@@ -392,77 +440,55 @@ class MainWindow(WindowControlsMixin, WidgetSetupMixin, QMainWindow):
         self.server_country_label.setText(f"<b>Country:</b> {country}")
         self.server_region_label.setText(f"<b>Region:</b> {region}")
         self.server_city_label.setText(f"<b>City:</b> {city}")
-
-        # Adjust label sizes
-        self.server_country_label.adjustSize()
-        self.server_region_label.adjustSize()
-        self.server_city_label.adjustSize()
     
+    @pyqtSlot(RoomInfo)
     def on_room_info_updated(self, room_info: RoomInfo):
         """Slot to handle room info updates"""
-        room_name = room_info.room_name if room_info.room_name else "N/A"
-        roomtype = room_info.roomtype if room_info.roomtype else "N/A"
-        description = room_info.description if room_info.description else "N/A"
-        tags = ", ".join(room_info.tags) if room_info.tags else "N/A"
-        
-        self.room_name_label.setText(f"<b>Room:</b> {room_name}")
-        self.room_type_label.setText(f"<b>Type:</b> {roomtype}")
-        self.room_description_label.setText(f"<b>Description:</b> {description}")
-        self.room_tags_label.setText(f"<b>Tags:</b> {tags}")
-        
-        # Adjust label sizes
-        self.room_name_label.adjustSize()
-        self.room_type_label.adjustSize()
-        self.room_description_label.adjustSize()
-        self.room_tags_label.adjustSize()
-
-        self.current_image_index = 0
-        self.loaded_images = []
-        self.total_images_expected = 0
-        self.last_image_change_time = datetime.datetime.now().timestamp()
-        self.current_room_name = room_name
-
-        if not room_info.picture_urls:
-            self.display_image_label.setPixmap(QPixmap())  # Clear image
-            self.image_counter_label.setText("0/0")
+        # Ignore updates that re-enter while one is still being applied
+        if self._updating_room:
             return
+        self._updating_room = True
+        try:
+            room_name = room_info.room_name if room_info.room_name else "N/A"
+            roomtype = room_info.roomtype if room_info.roomtype else "N/A"
+            description = room_info.description if room_info.description else "N/A"
+            tags = ", ".join(room_info.tags) if room_info.tags else "N/A"
+        
+            self.room_name_label.setText(f"<b>Room:</b> {room_name}")
+            self.room_type_label.setText(f"<b>Type:</b> {roomtype}")
+            self.room_description_label.setText(f"<b>Description:</b> {description}")
+            self.room_tags_label.setText(f"<b>Tags:</b> {tags}")
+
+            self.current_image_index = 0
+            self.loaded_images = []
+            self.loaded_image_data = []
+            self.total_images_expected = 0
+            self.current_room_name = room_name
+
+            # Restart the rotation interval so the first image of the new room gets its full time
+            if self._rotation_timer.isActive():
+                self._rotation_timer.start(self.time_between_image_changes * 1000)
+
+            if not room_info.picture_urls:
+                self.display_image_label.setPixmap(QPixmap())  # Clear image
+                self.image_counter_label.setText("0/0")
+                return
         
-        self.total_images_expected = len(room_info.picture_urls)
-        
-        QApplication.processEvents()
-        
-        self._show_loading_gif()
-        self.image_counter_label.setText(f"Loading...")
-
-        QApplication.processEvents()
-        
+            self.total_images_expected = len(room_info.picture_urls)
+            self.loaded_images = [None] * self.total_images_expected
+            self.loaded_image_data = [None] * self.total_images_expected
         
-        if hasattr(self, 'loading_movie'):
-            self.loading_movie.stop()
-            self.display_image_label.setMovie(None)
-        
-        # Store and display first image
-        self.image_counter_label.setText(f"1/{self.total_images_expected}")
-        loaded_first_image = False
-        for url in room_info.picture_urls:
-            image_data = download_image(url)
-            if image_data:
-                self.loaded_images.append(image_data)
-                if not loaded_first_image:
-                    pixmap = QPixmap()
-                    pixmap.loadFromData(image_data)
-                    scaled_pixmap = pixmap.scaled(
-                        self.display_image_label.width(),
-                        self.display_image_label.height(),
-                        Qt.KeepAspectRatioByExpanding,
-                        Qt.SmoothTransformation
-                    )
-                    self.display_image_label.setPixmap(scaled_pixmap)
-                    loaded_first_image = True
-            QApplication.processEvents()
-
+            self._show_loading_gif()
+            self.image_counter_label.setText(f"1/{self.total_images_expected}")
 
+            # Fetch every image at once; each one is shown as soon as it is ready
+            width, height = self._display_w, self._display_h
+            for index, url in enumerate(room_info.picture_urls):
+                self._dl_pool.submit(self._download_image_worker, index, url, room_name, width, height)
+        finally:
+            self._updating_room = False
 
+    @pyqtSlot()
     def on_forward_image_button_clicked(self):
         """Slot to handle forward image button click"""
         if self.total_images_expected == 0:
@@ -472,22 +498,13 @@ class MainWindow(WindowControlsMixin, WidgetSetupMixin, QMainWindow):
         
         self.image_counter_label.setText(f"{self.current_image_index + 1}/{self.total_images_expected}")
         
-        if self.current_image_index < len(self.loaded_images):
-            current_image = self.loaded_images[self.current_image_index]
-            if current_image:
-                pixmap = QPixmap()
-                pixmap.loadFromData(current_image)
-                scaled_pixmap = pixmap.scaled(
-                    self.display_image_label.width(),
-                    self.display_image_label.height(),
-                    Qt.KeepAspectRatioByExpanding,
-                    Qt.SmoothTransformation
-                )
-                self.display_image_label.setPixmap(scaled_pixmap)
+        if self.loaded_images[self.current_image_index] is not None:
+            self._display_loaded_image(self.current_image_index)
         else:
             # Image not loaded yet, show loading gif
             self._show_loading_gif()
 
+    @pyqtSlot()
     def on_backward_image_button_clicked(self):
         """Slot to handle backward image button click"""
         if self.total_images_expected == 0:
@@ -497,23 +514,14 @@ class MainWindow(WindowControlsMixin, WidgetSetupMixin, QMainWindow):
         
         self.image_counter_label.setText(f"{self.current_image_index + 1}/{self.total_images_expected}")
         
-        if self.current_image_index < len(self.loaded_images):
-            current_image = self.loaded_images[self.current_image_index]
-            if current_image:
-                pixmap = QPixmap()
-                pixmap.loadFromData(current_image)
-                scaled_pixmap = pixmap.scaled(
-                    self.display_image_label.width(),
-                    self.display_image_label.height(),
-                    Qt.KeepAspectRatioByExpanding,
-                    Qt.SmoothTransformation
-                )
-                self.display_image_label.setPixmap(scaled_pixmap)
+        if self.loaded_images[self.current_image_index] is not None:
+            self._display_loaded_image(self.current_image_index)
         else:
             # Image not loaded yet, show loading gif
             self._show_loading_gif()
 
 
+    @pyqtSlot()
     def on_persistent_window_button_toggled(self):
         """Slot to handle persistent window button toggled"""
         self.persistent_window = not self.persistent_window
@@ -526,6 +534,7 @@ class MainWindow(WindowControlsMixin, WidgetSetupMixin, QMainWindow):
         
         self.show()
     
+    @pyqtSlot()
     def on_toggle_rotating_images_clicked(self):
         """Slot to handle toggle rotating images button click"""
         self.rotating_images_enabled = not self.rotating_images_enabled
@@ -535,22 +544,28 @@ class MainWindow(WindowControlsMixin, WidgetSetupMixin, QMainWindow):
         set_value_in_config("rotating_images_enabled", self.rotating_images_enabled)
         
         if self.rotating_images_enabled:
-            self.last_image_change_time = datetime.datetime.now().timestamp()
+            self._rotation_timer.start(self.time_between_image_changes * 1000)
+        else:
+            self._rotation_timer.stop()
     
+    @pyqtSlot(bool)
     def on_update_start_scan_button_state(self, enabled):
         """Slot to handle start scan button state updates"""
         self.start_scan_button.setEnabled(enabled)
     
+    @pyqtSlot(bool)
     def on_update_stop_scan_button_state(self, enabled):
         """Slot to handle stop scan button state updates"""
         self.stop_scan_button.setEnabled(enabled)
 
+    @pyqtSlot()
     def on_debug_console_button_clicked(self):
         """Slot to handle debug console button click"""
         stats = self.scanner.get_debug_stats()
         self.debug_console_window.update_stats(stats)
         self.debug_console_window.show()
     
+    @pyqtSlot()
     def on_sync_button_clicked(self):
         """Slot to handle sync button click"""
         if not self.is_syncing:
@@ -585,6 +600,7 @@ class MainWindow(WindowControlsMixin, WidgetSetupMixin, QMainWindow):
             
             self.sync_window.hide()
 
+    @pyqtSlot(str)
     def on_version_check_ready(self, latest_version: str):
         """Slot to handle version check completion"""
         if not latest_version or latest_version == "unknown":
@@ -610,18 +626,23 @@ class MainWindow(WindowControlsMixin, WidgetSetupMixin, QMainWindow):
         else:
             self.log_console_message.emit(f"Running latest version: {VERSION}")
     
+    @pyqtSlot()
     def on_clear_console_clicked(self):
         """Slot to handle clear console button click"""
+        self._log_buffer.clear()
         self.console_text_area.clear()
         self.log_console_message.emit(f"Console cleared (version: {VERSION})")
     
+    @pyqtSlot()
     def on_copy_console_clicked(self):
         """Slot to handle copy console button click"""
+        self.flush_log_buffer()
         console_text = self.console_text_area.toPlainText()
         clipboard = QApplication.clipboard()
         clipboard.setText(console_text)
         self.log_console_message.emit("Console text copied to clipboard")
     
+    @pyqtSlot()
     def on_set_log_dir_clicked(self):
         """Slot to handle set log directory button click"""
         from src.app.user_data.appdata import get_value_from_config
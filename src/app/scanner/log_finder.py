@@ -3,12 +3,70 @@
 # January 2026
 
 import os
+import stat
+import time
 import platform
 import glob 
+import functools
 from config.vars import USER_LOG_PATH
 
 PLATFORM = platform.system().lower()
 
+# File listing per directory, keyed on the directory's own mtime (it only changes when files are added or removed)
+_listing_cache: dict[str, tuple[int, tuple[str, ...]]] = {}
+
+# Expanded Linux candidate directories are re-globbed after this many seconds
+_CANDIDATE_DIRS_REFRESH_SEC = 300
+_candidate_dirs_expanded_at = 0.0
+
+def clear_log_finder_cache() -> None:
+    """Forget all cached directory scans and expanded candidate directories."""
+    _listing_cache.clear()
+    clear_candidate_dirs_cache()
+
+def _list_files(directory: str) -> tuple[str, ...]:
+    """
+    List the files in a directory, reusing the last listing if the directory hasn't changed.
+    
+    Args:
+        directory (str): The directory to list.
+    Returns:
+        tuple[str, ...]: Paths of the files in the directory
+    """
+    dir_mtime = os.stat(directory).st_mtime_ns
+    cached = _listing_cache.get(directory)
+    if cached and cached[0] == dir_mtime:
+        return cached[1]
+
+    # DirEntry takes the file type from the directory listing, only symlinks need an extra stat
+    with os.scandir(directory) as entries:
+        files = tuple(entry.path for entry in entries if entry.is_file())
+
+    _listing_cache[directory] = (dir_mtime, files)
+    return files
+
+def _scan_directory(directory: str) -> tuple[str | None, int]:
+    """
+    Find the newest file in a directory by its current mtime.
+    
+    Args:
+        directory (str): The directory to search for files.
+    Returns:
+        tuple[str | None, int]: The path to the latest file (or None) and its mtime in nanoseconds
+    """
+    latest_path = None
+    latest_mtime = 0
+    # Appending to a log doesn't touch the directory mtime, so the files are always re-ranked
+    for path in _list_files(directory):
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            continue  # Removed since the listing was taken
+        if latest_path is None or mtime > latest_mtime:
+            latest_path = path
+            latest_mtime = mtime
+    return latest_path, latest_mtime
+
 def _get_latest_file_from_directory(directory: str) -> str | None:
     """
     Get the latest file from a specified directory.
@@ -18,17 +76,13 @@ def _get_latest_file_from_directory(directory: str) -> str | None:
     Returns:
         str | None: The path to the latest file, or None if no files are found
     """
-    try:
-        files = [os.path.join(directory, f) for f in os.listdir(directory) if os.path.isfile(os.path.join(directory, f))]
-        latest_file = max(files, key=os.path.getmtime)
-        return latest_file
-    except ValueError:
-        return None
+    return _scan_directory(directory)[0]
     
-def _look_for_linux_logdir_path() -> str | None:
+@functools.lru_cache(maxsize=1)
+def _expand_candidate_dirs() -> tuple[str, ...]:
     """
-    Look for the Roblox log file in common Linux/Wine/Proton/Sober locations.
-    Returns the newest log file path if found.
+    Expand the wildcard Linux/Wine/Proton/Sober log locations into existing directories.
+    Cached since walking every Steam compatdata prefix is slow and the set rarely changes.
     """
     home = os.path.expanduser('~')
 
@@ -44,6 +98,27 @@ def _look_for_linux_logdir_path() -> str | None:
     dirs = []
     for d in candidate_dirs:
         dirs.extend(glob.glob(d))
+    return tuple(dirs)
+
+def clear_candidate_dirs_cache() -> None:
+    """Forget the expanded Linux candidate directories so the next lookup globs again."""
+    global _candidate_dirs_expanded_at
+    _expand_candidate_dirs.cache_clear()
+    _candidate_dirs_expanded_at = 0.0
+
+def _look_for_linux_logdir_path() -> str | None:
+    """
+    Look for the Roblox log file in common Linux/Wine/Proton/Sober locations.
+    Returns the newest log file path if found.
+    """
+    global _candidate_dirs_expanded_at
+
+    # Re-expand the wildcards now and then so newly created prefixes are picked up
+    now = time.monotonic()
+    if now - _candidate_dirs_expanded_at > _CANDIDATE_DIRS_REFRESH_SEC:
+        _expand_candidate_dirs.cache_clear()
+        _candidate_dirs_expanded_at = now
+    dirs = _expand_candidate_dirs()
 
     # pick newest log from all dirs
     latest_file = None
@@ -51,15 +126,27 @@ def _look_for_linux_logdir_path() -> str | None:
     for d in dirs:
         if not os.path.isdir(d):
             continue
-        files = [os.path.join(d, f) for f in os.listdir(d) if os.path.isfile(os.path.join(d, f))]
-        for f in files:
-            mtime = os.path.getmtime(f)
-            if mtime > latest_mtime:
-                latest_mtime = mtime
-                latest_file = f
+        path, mtime = _scan_directory(d)
+        if path and mtime > latest_mtime:
+            latest_mtime = mtime
+            latest_file = path
 
     return latest_file
 
+# Platform default lookup, chosen once at import since it can't change while the app runs
+if PLATFORM == 'windows':
+    _DEFAULT_LOG_DIR = os.path.join(os.getenv('LOCALAPPDATA', ''), 'Roblox', 'logs')
+elif PLATFORM == 'darwin':  # macOS
+    _DEFAULT_LOG_DIR = os.path.join(os.path.expanduser('~'), 'Library', 'Logs', 'Roblox')
+else:  # Linux / Wine / Proton / Sober
+    _DEFAULT_LOG_DIR = None
+
+def _get_latest_file_from_default_dir() -> str | None:
+    """Get the latest file from the platform's default Roblox log directory."""
+    return _get_latest_file_from_directory(_DEFAULT_LOG_DIR)
+
+_find_default_log_file = _get_latest_file_from_default_dir if _DEFAULT_LOG_DIR else _look_for_linux_logdir_path
+
 def get_latest_log_file_path() -> str | None:
     """
     Determine the latest log file path based on the operating system and user configuration.
@@ -68,19 +155,16 @@ def get_latest_log_file_path() -> str | None:
         str | None: The path to the latest log file, or None if not found.
     """
     if USER_LOG_PATH != '':
-        if os.path.isfile(USER_LOG_PATH):
+        # One stat answers both the file and directory checks
+        try:
+            st = os.stat(USER_LOG_PATH)
+        except OSError:
+            return None
+        if stat.S_ISREG(st.st_mode):
             return USER_LOG_PATH
-        elif os.path.isdir(USER_LOG_PATH):
+        elif stat.S_ISDIR(st.st_mode):
             return _get_latest_file_from_directory(USER_LOG_PATH)
         else:
             return None
-    
-    if PLATFORM == 'windows':
-        default_dir = os.path.join(os.getenv('LOCALAPPDATA', ''), 'Roblox', 'logs')
-    elif PLATFORM == 'darwin':  # macOS
-        default_dir = os.path.join(os.path.expanduser('~'), 'Library', 'Logs', 'Roblox')
-    else:  # Linux / Wine / Proton / Sober
-        return _look_for_linux_logdir_path()
-        
-
-    return _get_latest_file_from_directory(default_dir)
\ No newline at end of file
+
+    return _find_default_log_file()
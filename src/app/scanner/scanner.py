@@ -3,19 +3,58 @@
 # January 2026]]
 
 import asyncio
+import os
 import time
 import traceback
 import threading
+from collections import deque
 
-from config.vars import session_config
+from watchfiles import awatch, Change
+
+from config.vars import session_config, SCANNER_DEBUG
 from src.api.scanner import request_session, end_session, room_encountered, RoomInfo, check_scanner_version
 from src.api.websocket import report_encountered_room, get_active_websocket
 from src.app.scanner.stalker import Stalker
-from src.app.scanner.parser import parse_log_lines
+from src.app.scanner.parser import LogParser
 from src.app.scanner.log_finder import get_latest_log_file_path
 
+FILE_CHECK_INTERVAL = 25  # Seconds between fallback checks for a newer log file
+
+class ScannerStats:
+    """Debug counters for the scanner, slotted so increments are plain attribute stores."""
+    __slots__ = (
+        "file_checks",
+        "file_switches",
+        "api_calls",
+        "session_requests",
+        "total_rooms_reported",
+        "scanner_iterations",
+        "errors_caught"
+    )
+
+    def __init__(self):
+        for name in self.__slots__:
+            setattr(self, name, 0)
+
+    def as_dict(self) -> dict:
+        """Return the counters as a dictionary."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
 class Scanner:
     """Scanner object to manage the scanning task."""
+    # Fixed attribute set: faster lookups and typos raise instead of creating new attributes
+    __slots__ = (
+        "task", "alive", "thread", "loop", "has_session", "_signals_validated",
+        "loop_interval", "stalker", "parser", "latest_rooms", "_latest_set",
+        "current_path", "last_scanned_path",
+        "_watch_stop_event", "_read_lock", "debug_stats", "last_file_check_time",
+        # Signals, only present once set by the GUI
+        "update_server_info", "update_room_info", "update_start_button", "update_stop_button",
+        "log_console_message", "version_check_ready", "debug_console_message",
+        # Cached emit methods of the most used signals
+        "_emit_room_info", "_emit_server_info", "_emit_console_message", "_emit_debug_message"
+    )
+
     def __init__(self):
         self.task = None  # Asyncio task
         self.alive = False
@@ -23,28 +62,28 @@ class Scanner:
         self.loop = None  # Asyncio event loop
 
         self.has_session = False
+        self._signals_validated = False  # Set once all required signals have been connected
 
         # Scanner configuration
-        self.loop_interval = 0.5  # Seconds between line parses
+        self.loop_interval = 0.5  # Seconds between retries while no log file is available
         self.stalker = None  # To be set to Stalker instance
-        self.latest_rooms = []  # List of up to 5 latest scanned room names to prevent duplicates
+        self.parser = LogParser()  # Reused for every batch so disconnect state carries over
+        self.latest_rooms = deque(maxlen=5)  # Up to 5 latest scanned room names to prevent duplicates
+        self._latest_set = set()  # Same names as latest_rooms, for O(1) membership checks
         self.current_path = None  # Current log file path being monitored
         self.last_scanned_path = None  # Last scanned log file path
+        self._watch_stop_event = None  # Ends the current directory watch (asyncio.Event on the scanner loop)
+        self._read_lock = None  # Serializes log reads between the watcher and housekeeping
 
         # Debug statistics
-        self.debug_stats = {
-            "file_checks": 0,
-            "file_switches": 0,
-            "api_calls": 0,
-            "session_requests": 0,
-            "total_rooms_reported": 0,
-            "scanner_iterations": 0,
-            "errors_caught": 0
-        }
+        self.debug_stats = ScannerStats()
         self.last_file_check_time = time.time()
 
-        version_thread = threading.Thread(target=self._run_version_check_loop, daemon=True)
-        version_thread.start()
+        # Bound emit methods, set together with their signals
+        self._emit_room_info = None
+        self._emit_server_info = None
+        self._emit_console_message = None
+        self._emit_debug_message = None
 
     def start(self):
         """Start the scanning task in a separate thread."""
@@ -63,7 +102,7 @@ class Scanner:
             self._log_debug_message("Entering async event loop")
             self._run_async_loop()
         except Exception as e:
-            self.debug_stats["errors_caught"] += 1
+            self.debug_stats.errors_caught += 1
             self._log_console_message(f"CRITICAL ERROR: Scanner thread crashed: {e}")
             self._log_debug_message(f"Scanner thread exception details: {type(e).__name__}: {e}")
             self._log_debug_message(f"Traceback: {traceback.format_exc()}")
@@ -83,16 +122,16 @@ class Scanner:
         self.loop.run_until_complete(self.scanner_loop())
         self._log_debug_message("Scanner loop completed")
 
-    def _run_version_check_loop(self):
-        """Run version check in separate thread with its own event loop."""
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        loop.run_until_complete(self.version_check_loop())
-
     def stop(self):
         """Stop the scanning task."""
         self._log_debug_message("Stop command received")
         self.alive = False
+        # Wake the directory watcher so the scanner thread can exit
+        if self.loop and self._watch_stop_event:
+            try:
+                self.loop.call_soon_threadsafe(self._watch_stop_event.set)
+            except RuntimeError:
+                pass  # Loop already closed
         self.update_start_button.emit(True)   # Enable start button
         self.update_stop_button.emit(False)    # Disable stop button
         self._log_console_message("Scanner has been stopped.")
@@ -113,7 +152,7 @@ class Scanner:
 
         # Only request a session if we don't have one AND there are rooms to report
         if not self.has_session and parsed_rooms:
-            self.debug_stats["session_requests"] += 1
+            self.debug_stats.session_requests += 1
             self._log_debug_message("Requesting new API session...")
             success = await request_session()
             if not success:
@@ -122,41 +161,65 @@ class Scanner:
             self.has_session = True
             self._log_debug_message("Session request successful")
         
-        latest_room = None
+        # Decide which rooms are new in log order, then look them all up concurrently
+        encounters = []
         for room in parsed_rooms:
-            self.debug_stats["api_calls"] += 1
-            self.debug_stats["total_rooms_reported"] += 1
-            if room in self.latest_rooms:
+            self.debug_stats.api_calls += 1
+            self.debug_stats.total_rooms_reported += 1
+            if room in self._latest_set:
                 self._log_console_message(f"Returned to room: {room}.")
-                self._log_debug_message(f"API call: room_encountered (duplicate room: {room}) with logging=False")
-                _, latest_room = await room_encountered(room_name=room, log_event=False)
+                if SCANNER_DEBUG:
+                    self._log_debug_message(f"API call: room_encountered (duplicate room: {room}) with logging=False")
+                encounters.append(room_encountered(room_name=room, log_event=False))
             else:
+                if len(self.latest_rooms) == self.latest_rooms.maxlen:
+                    self._latest_set.discard(self.latest_rooms[0])  # Oldest room is about to be evicted
                 self.latest_rooms.append(room)
-                if len(self.latest_rooms) > 5:
-                    self.latest_rooms.pop(0)  # Maintain only the last 5 rooms
+                self._latest_set.add(room)
                 self._log_console_message(f"Encountered new room: {room}.")
-                self._log_debug_message(f"API call: room_encountered (new room: {room}) with logging=True")
-                _, latest_room = await room_encountered(room_name=room, log_event=True)
+                if SCANNER_DEBUG:
+                    self._log_debug_message(f"API call: room_encountered (new room: {room}) with logging=True")
+                encounters.append(room_encountered(room_name=room, log_event=True))
 
-            websocket = get_active_websocket()
-            if websocket:
+        # gather keeps results in call order, so the last one is the latest room
+        results = await asyncio.gather(*encounters)
+        latest_room = results[-1][1] if results else None
+
+        websocket = get_active_websocket()
+        if websocket:
+            for room in parsed_rooms:
                 try:
-                    self._log_debug_message(f"Websocket: Reporting room {room}")
+                    if SCANNER_DEBUG:
+                        self._log_debug_message(f"Websocket: Reporting room {room}")
                     await report_encountered_room(websocket, room)
                 except Exception as e:
                     self._log_debug_message(f"Websocket error reporting room: {e}")
     
         return latest_room
     
+    def get_latest_room(self) -> str | None:
+        """
+        Get the most recently encountered room name.
+        Reads the list once so a concurrent update from the scanner thread can't empty it in between.
+        
+        Returns:
+            str | None: The latest room name, or None if no room has been encountered
+        """
+        try:
+            return self.latest_rooms[-1]
+        except IndexError:
+            return None
+    
     def _reset_scanner_visuals(self):
         """Reset scanner-related UI elements via signals."""
-        self.update_room_info.emit(RoomInfo())  # Clear room info display by sending empty RoomInfo
-        self.update_server_info.emit({})  # Clear server info display by sending empty dict
+        self._emit_room_info(RoomInfo())  # Clear room info display by sending empty RoomInfo
+        self._emit_server_info({})  # Clear server info display by sending empty dict
     
     async def reset(self):
         """Reset the scanner state."""
         self._log_debug_message("Resetting scanner state...")
         self.latest_rooms.clear()
+        self._latest_set.clear()
         await end_session()
         session_config.clear_session()  # Clear expired credentials
         self.has_session = False  # Force new session request
@@ -166,6 +229,9 @@ class Scanner:
 
     def _validate_signals_setup(self):
         """Ensure that all required signals are set up."""
+        # Signals are never removed once set, so a successful check is remembered
+        if self._signals_validated:
+            return True
         required_signals = [
             'update_server_info',
             'update_room_info',
@@ -177,144 +243,242 @@ class Scanner:
         for signal_name in required_signals:
             if not hasattr(self, signal_name):
                 return False
+        self._signals_validated = True
         return True
 
     async def scanner_loop(self):
-        """Asynchronous loop to run the scan function at specified intervals."""
+        """Asynchronous loop that reads the log file whenever the OS reports a change to it."""
         self._log_debug_message("Initializing scanner loop")
         self.stalker = Stalker()
         self._log_debug_message("Stalker initialized")
 
-        self.current_path = get_latest_log_file_path()
-
         try:
-            with open(self.current_path, "r", encoding="utf-8", errors="replace") as logfile:
-                self.stalker.find_starting_point(logfile)
+            self.current_path = get_latest_log_file_path()
+        except OSError as e:
+            self.debug_stats.errors_caught += 1
+            self._log_debug_message(f"Error finding log file: {type(e).__name__}: {e}")
+            self.current_path = None  # Searched for again by the watch loop
+
+        if self.current_path:
+            try:
+                self._open_logfile()
+                self.stalker.find_starting_point()
                 self._log_debug_message(f"Stalker starting point set to last disconnect entry at position {self.stalker.file_position}")
-        except (IOError, OSError) as e:
-            self.debug_stats["errors_caught"] += 1
-            self._log_debug_message(f"Error initializing stalker starting point: {e}")
+            except (IOError, OSError) as e:
+                self.debug_stats.errors_caught += 1
+                self._log_debug_message(f"Error initializing stalker starting point: {e}")
 
-        _no_new_lines_accumulator = 0
+        self._read_lock = asyncio.Lock()  # Watcher and housekeeping must not read the file at the same time
         
         self._log_debug_message("Entering main scanner loop")
+        housekeeping_task = asyncio.create_task(self._housekeeping_loop())
+        try:
+            await self._file_watch_loop()
+        finally:
+            housekeeping_task.cancel()
+            self.stalker.close()
+
+    def _open_logfile(self):
+        """Make sure the stalker holds a descriptor on current_path."""
+        if self.stalker.open_log(self.current_path):
+            self._log_debug_message(f"Opened log file handle: {self.current_path}")
+
+    async def _file_watch_loop(self):
+        """Watch the log directory and read new lines each time the current log file is modified."""
         while self.alive:
-            await asyncio.sleep(self.loop_interval)
-            self.debug_stats["scanner_iterations"] += 1
-
             if not self._validate_signals_setup():
                 print("Scanner signals not properly set up, skipping iteration")
+                await asyncio.sleep(self.loop_interval)
                 continue  # Signals not properly set up
 
-            if not self.stalker:
-                continue  # Stalker not initialized yet
-
             # Ensure we have a log file path
             if not self.current_path:
-                try:
+                if SCANNER_DEBUG:
                     self._log_debug_message("Searching for log file...")
+                try:
                     self.current_path = get_latest_log_file_path()
-                    self.stalker.file_position = 0  # Reset file position for new log file
-                    self._log_console_message(f"Monitoring log file: {self.current_path}")
-                    self._log_debug_message(f"Log file found and monitoring started: {self.current_path}")
-                except (EnvironmentError, FileNotFoundError) as e:
-                    self.debug_stats["errors_caught"] += 1
+                except OSError as e:
+                    # Logs directory may not exist yet (Roblox not installed or not launched)
+                    self.debug_stats.errors_caught += 1
                     self._log_debug_message(f"Error finding log file: {type(e).__name__}: {e}")
+                    await asyncio.sleep(self.loop_interval)
+                    continue
+                if not self.current_path:
+                    await asyncio.sleep(self.loop_interval)
                     continue
-            
-            # Open the log file and observe changes
+                self.stalker.file_position = 0  # Reset file position for new log file
+                self._log_console_message(f"Monitoring log file: {self.current_path}")
+                self._log_debug_message(f"Log file found and monitoring started: {self.current_path}")
+
+            # Catch up on anything written before the watcher started
+            await self._process_new_lines()
+            if not self.current_path:
+                continue
+
+            # Set by stop() or by a log file switch to end this watch session
+            self._watch_stop_event = asyncio.Event()
+            watch_dir = os.path.dirname(self.current_path)
+            self._log_debug_message(f"Watching log directory: {watch_dir}")
             try:
-                with open(self.current_path, "r", encoding="utf-8", errors="replace") as logfile:
-                    new_lines = self.stalker.observe_logfile_changes(logfile)
-            except (IOError, OSError) as e:
-                # File might have been deleted, clear path and retry
-                self.debug_stats["errors_caught"] += 1
-                self._log_debug_message(f"Error reading log file: {e}")
+                async for changes in awatch(watch_dir, watch_filter=None, stop_event=self._watch_stop_event, debounce=50, step=10, recursive=False):
+                    self.debug_stats.scanner_iterations += 1
+                    current_key = os.path.normcase(os.path.abspath(self.current_path))
+                    file_added = False
+                    file_modified = False
+                    for change, path in changes:
+                        if change == Change.added and os.path.normcase(path) != current_key:
+                            file_added = True  # New log created (or moved in), check if it is the latest
+                        elif change == Change.modified and os.path.normcase(path) == current_key:
+                            file_modified = True
+
+                    if file_modified:
+                        await self._process_new_lines()
+                    if file_added:
+                        await self._check_for_new_log_file()
+                    if not self.current_path:
+                        break  # Log file became unreadable, look for it again
+            except (OSError, RuntimeError) as e:
+                self.debug_stats.errors_caught += 1
+                self._log_debug_message(f"Error watching log directory: {type(e).__name__}: {e}")
                 self.current_path = None
-                continue
+                await asyncio.sleep(self.loop_interval)
 
-            if not new_lines:
-                _no_new_lines_accumulator += 1
-                if _no_new_lines_accumulator >= 50:
-                    self.debug_stats["file_checks"] += 1
-                    current_time = time.time()
-                    time_since_last_check = current_time - self.last_file_check_time
-                    self.last_file_check_time = current_time
-                    self._log_debug_message(f"Checking for new log file (last check: {time_since_last_check:.1f}s ago)")
-                    latest_file = get_latest_log_file_path()
-                    if latest_file != self.current_path:
-                        self.debug_stats["file_switches"] += 1
-                        self.current_path = latest_file
-                        self.stalker.file_position = 0  # Reset file position for new log file
-                        self._log_console_message(f"Switched to new log file: {self.current_path}")
-                        self._log_debug_message(f"File switch detected: {self.current_path}")
-                        # Reset scanner 
-                        await self.reset()
-                    _no_new_lines_accumulator = 0
+    async def _housekeeping_loop(self):
+        """Periodically catch up on changes and log switches the watcher may have missed."""
+        while self.alive:
+            # Windows may only report a modification once the write is flushed to disk, so catch up often.
+            # A read at the end of the file is a single pread that returns nothing.
+            await asyncio.sleep(1)
+            if not self.current_path:
                 continue
+            await self._process_new_lines()
+
+            # The newest log may appear outside the watched directory (e.g. another Wine/Proton prefix on Linux)
+            if self.current_path and time.time() - self.last_file_check_time >= FILE_CHECK_INTERVAL:
+                try:
+                    await self._check_for_new_log_file()
+                except OSError as e:
+                    self.debug_stats.errors_caught += 1
+                    self._log_debug_message(f"Error checking for new log file: {type(e).__name__}: {e}")
 
-            parsed_results = parse_log_lines(new_lines)
-            rooms = parsed_results.get("rooms", [])
-            location = parsed_results.get("location", None)
-            disconnected = parsed_results.get("disconnected", False)
-            lines_parsed = parsed_results.get("lines_parsed", 0)
-            
-            if lines_parsed > 0:
-                self._log_debug_message(f"Parsed {lines_parsed} new lines - rooms: {len(rooms)}, location: {location is not None}, disconnect: {disconnected}")
-
-            # Process parsed results
-            if rooms:
-                self._log_debug_message(f"Processing {len(rooms)} room(s): {rooms}")
-            latest_room = await self.report_new_rooms(rooms)
-
-            if latest_room:
-                self.update_room_info.emit(latest_room)
-
-            if location:
-                self._log_console_message(f"Location updated: {location}")
-                self._log_debug_message(f"Server location detected: {location}")
-                self.update_server_info.emit(location)
-            
-            # Reset state on disconnect
-            if disconnected:
-                self._log_debug_message("Disconnect detected, resetting scanner state")
-                await self.reset()
+    async def _check_for_new_log_file(self) -> bool:
+        """
+        Switch to the newest log file if it differs from the one being monitored.
+        
+        Returns:
+            bool: True if the scanner switched to a new log file
+        """
+        self.debug_stats.file_checks += 1
+        current_time = time.time()
+        time_since_last_check = current_time - self.last_file_check_time
+        self.last_file_check_time = current_time
+        if SCANNER_DEBUG:
+            self._log_debug_message(f"Checking for new log file (last check: {time_since_last_check:.1f}s ago)")
+        latest_file = get_latest_log_file_path()
+        if not latest_file or latest_file == self.current_path:
+            return False
+
+        self.debug_stats.file_switches += 1
+        watched_dir = os.path.dirname(self.current_path) if self.current_path else None
+        async with self._read_lock:  # Don't switch files under a read in progress
+            self.current_path = latest_file
+            self.stalker.file_position = 0  # Reset file position for new log file
+            self.stalker.close()  # Release the old log so Roblox can clean it up
+        self._log_console_message(f"Switched to new log file: {self.current_path}")
+        self._log_debug_message(f"File switch detected: {self.current_path}")
+        # Re-watch if the new file lives in another directory
+        if os.path.dirname(latest_file) != watched_dir and self._watch_stop_event:
+            self._watch_stop_event.set()
+        # Reset scanner 
+        await self.reset()
+        return True
+
+    async def _process_new_lines(self):
+        """Read and handle new lines from the current log file until it is drained."""
+        async with self._read_lock:
+            while self.alive and self.current_path:
+                # Open the log file and observe changes
+                try:
+                    self._open_logfile()
+                    new_lines = self.stalker.observe_logfile_changes()
+                except (IOError, OSError) as e:
+                    # File might have been deleted, clear path and retry
+                    self.debug_stats.errors_caught += 1
+                    self._log_debug_message(f"Error reading log file: {e}")
+                    self.stalker.close()
+                    self.current_path = None
+                    return
+
+                if not new_lines:
+                    return
+
+                await self._handle_new_lines(new_lines)
+
+    async def _handle_new_lines(self, new_lines: list[str]):
+        """Parse a batch of log lines and report what was found."""
+        parsed_results = self.parser.parse_log_lines(new_lines)
+        rooms = parsed_results.rooms
+        location = parsed_results.location
+        disconnected = parsed_results.disconnected
+        lines_parsed = parsed_results.lines_parsed
+        
+        if SCANNER_DEBUG and lines_parsed > 0:
+            self._log_debug_message(f"Parsed {lines_parsed} new lines - rooms: {len(rooms)}, location: {location is not None}, disconnect: {disconnected}")
+
+        # Process parsed results
+        if SCANNER_DEBUG and rooms:
+            self._log_debug_message(f"Processing {len(rooms)} room(s): {rooms}")
+        latest_room = await self.report_new_rooms(rooms)
+
+        if latest_room:
+            self._emit_room_info(latest_room)
+
+        if location:
+            self._log_console_message(f"Location updated: {location}")
+            self._log_debug_message(f"Server location detected: {location}")
+            self._emit_server_info(location)
+        
+        # Reset state on disconnect
+        if disconnected:
+            self._log_debug_message("Disconnect detected, resetting scanner state")
+            await self.reset()
 
 
     def _log_console_message(self, message: str):
         """Log a message to the console via signal."""
-        if not hasattr(self, 'log_console_message'):
+        if self._emit_console_message is None:
             return
-        self.log_console_message.emit(message)
+        self._emit_console_message(message)
 
     def _log_debug_message(self, message: str):
         """Log a debug message to the debug console via signal."""
-        if not hasattr(self, 'debug_console_message'):
+        if self._emit_debug_message is None:
             return
-        self.debug_console_message.emit(message)
+        self._emit_debug_message(message)
 
     def get_debug_stats(self) -> dict:
         """Return current debug statistics."""
-        stats = self.debug_stats.copy()
+        stats = self.debug_stats.as_dict()
         if self.stalker:
             stats["stalker_reads"] = self.stalker.total_reads
             stats["stalker_lines_read"] = self.stalker.total_lines_read
             stats["stalker_empty_reads"] = self.stalker.empty_reads
+            stats["stalker_avg_read_us"] = self.stalker.average_read_us
         
-        # Import parser stats
-        from src.app.scanner.parser import get_parser_stats
-        parser_stats = get_parser_stats()
-        stats.update(parser_stats)
+        # Add parser stats
+        stats.update(self.parser.get_stats())
         
         return stats
 
     def set_server_info_signal(self, signal):
         """Set the signal for server info updates."""
         self.update_server_info = signal
+        self._emit_server_info = signal.emit
 
     def set_room_info_signal(self, signal):
         """Set the signal for room info updates."""
         self.update_room_info = signal
+        self._emit_room_info = signal.emit
 
     def set_start_button_signal(self, signal):
         """Set the signal for start button state updates."""
@@ -327,6 +491,7 @@ class Scanner:
     def set_log_console_message_signal(self, signal):
         """Set the signal for logging messages to console."""
         self.log_console_message = signal
+        self._emit_console_message = signal.emit
 
     def set_version_check_ready_signal(self, signal):
         """Set the signal for version check ready notification."""
@@ -335,6 +500,7 @@ class Scanner:
     def set_debug_console_message_signal(self, signal):
         """Set the signal for debug console messages."""
         self.debug_console_message = signal
+        self._emit_debug_message = signal.emit
 
     async def version_check_loop(self):
         """Wait for scanner to be ready, then perform version check."""
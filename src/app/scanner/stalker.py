@@ -2,58 +2,202 @@
 # Main orchestrator for log file scanning
 # January 2026
 
-from io import TextIOWrapper
+import mmap
+import os
+import re
+import time
+from array import array
 
-MAX_READ_LINES = 50 # Maximum lines to read per interval
+MAX_READ_BYTES = 1 << 16 # Maximum bytes to read per call (64 KiB, a whole number of pages), caps reads by size rather than line count
+_DISCONNECT_MARKER = b"[flog::network] client:disconnect"
+_DISCONNECT_MARKER_RE = re.compile(re.escape(_DISCONNECT_MARKER), re.IGNORECASE)  # Matches any case without a lowered copy of the chunk
+
+def _read_at(fd: int, length: int, offset: int) -> bytes:
+    """Read up to length bytes at offset, using os.pread where the platform has it."""
+    if hasattr(os, "pread"):
+        return os.pread(fd, length, offset)
+    os.lseek(fd, offset, os.SEEK_SET)  # Windows has no pread
+    return os.read(fd, length)
+
+def _read_into(fd: int, buffer: bytearray, offset: int) -> int:
+    """Fill buffer from offset and return the number of bytes read, without allocating where os.preadv exists."""
+    if hasattr(os, "preadv"):
+        return os.preadv(fd, [buffer], offset)
+    data = _read_at(fd, len(buffer), offset)  # Windows has no preadv, copy into the buffer instead
+    buffer[:len(data)] = data
+    return len(data)
+
+def _find_last_marker_line_end(read, size: int) -> int:
+    """
+    Scan backwards for the last disconnect marker and return the offset just past its line.
+
+    Args:
+        read: Callable (start, end) -> bytes returning that byte range of the file.
+        size (int): Size of the file in bytes.
+    Returns:
+        int: Offset after the marker's line, the file size if that line has no newline, or 0 if there is no marker.
+    """
+    overlap = len(_DISCONNECT_MARKER) - 1  # Catch a marker split across two chunks
+
+    chunk_end = size
+    while chunk_end > 0:
+        chunk_start = max(0, chunk_end - MAX_READ_BYTES)
+        read_end = min(size, chunk_end + overlap)
+        last_match = None
+        for last_match in _DISCONNECT_MARKER_RE.finditer(read(chunk_start, read_end)):
+            pass
+        if last_match is not None:
+            # Walk forward to the end of the marker's line
+            offset = chunk_start + last_match.end()
+            while offset < size:
+                chunk = read(offset, min(size, offset + MAX_READ_BYTES))
+                if not chunk:
+                    break  # File shrank underneath us
+                newline = chunk.find(b"\n")
+                if newline != -1:
+                    return offset + newline + 1
+                offset += len(chunk)
+            return size
+        chunk_end = chunk_start
+    return 0
+
+def _mapped_reader(mapped: mmap.mmap):
+    """
+    Return a (start, end) -> bytes reader over a mapping for the backwards marker scan.
+    Where supported, the window before the one being read is prefetched so its pages are
+    already loaded when the scan moves on to it.
+    """
+    if not hasattr(mapped, "madvise") or not hasattr(mmap, "MADV_WILLNEED"):
+        return lambda start, end: mapped[start:end]  # Windows has no madvise
+
+    def read(start: int, end: int) -> bytes:
+        prefetch_start = max(0, start - MAX_READ_BYTES) & ~(mmap.PAGESIZE - 1)  # madvise needs a page-aligned start
+        if prefetch_start < start:
+            try:
+                mapped.madvise(mmap.MADV_WILLNEED, prefetch_start, start - prefetch_start)
+            except OSError:
+                pass  # Only a hint
+        return mapped[start:end]
+    return read
 
 class Stalker:
+    # Fixed attribute set, read on every poll
+    __slots__ = ("fd", "path", "file_position", "_buf", "_stats")
+
     def __init__(self):
-        self.file = None
+        self.fd = None  # Raw file descriptor kept open on path between reads
+        self.path = None  # Path the held descriptor was opened on
         self.file_position = 0
+        self._buf = bytearray(MAX_READ_BYTES)  # Reused by every read
+
+        # Debug stats: total reads, total lines read, empty reads, total read time in ns (one object updated in place per poll)
+        self._stats = array("q", [0, 0, 0, 0])
+
+    @property
+    def total_reads(self) -> int:
+        return self._stats[0]
+
+    @property
+    def total_lines_read(self) -> int:
+        return self._stats[1]
+
+    @property
+    def empty_reads(self) -> int:
+        return self._stats[2]
 
-        # Debug stats
-        self.total_reads = 0
-        self.total_lines_read = 0
-        self.empty_reads = 0
+    @property
+    def average_read_us(self) -> float:
+        """Average time spent in observe_logfile_changes, in microseconds."""
+        reads = self._stats[0]
+        return self._stats[3] / reads / 1000 if reads else 0.0
 
-    def find_starting_point(self, file: TextIOWrapper) -> None:
+    def open_log(self, path: str) -> bool:
         """
-        Sets the file position to the latest disconnect entry in the log file.
+        Make sure the descriptor is open on path, reopening it if the path changed.
 
-        Find: if "[flog::network] client:disconnect" in u_line:
+        Args:
+            path (str): Path to the log file.
+        Returns:
+            bool: True if a new descriptor was opened, False if the held one was reused.
         """
+        if self.fd is not None and self.path == path:
+            return False
+        self.close()
+        # O_BINARY only exists (and is needed) on Windows
+        flags = os.O_RDONLY | getattr(os, "O_BINARY", 0)
+        try:
+            # Skip atime updates on every read (Linux, only allowed if we own the file)
+            self.fd = os.open(path, flags | getattr(os, "O_NOATIME", 0))
+        except PermissionError:
+            self.fd = os.open(path, flags)
+        # The log is only ever read forward once, tell the kernel so it can read ahead and drop old pages
+        if hasattr(os, "posix_fadvise"):
+            try:
+                os.posix_fadvise(self.fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                os.posix_fadvise(self.fd, 0, 0, os.POSIX_FADV_NOREUSE)
+            except OSError:
+                pass  # Advice only, some filesystems don't support it
+        self.path = path
+        return True
 
+    def close(self) -> None:
+        """Close the held log file descriptor, if any."""
+        if self.fd is not None:
+            try:
+                os.close(self.fd)
+            except OSError:
+                pass
+            self.fd = None
+            self.path = None
+
+    def find_starting_point(self) -> None:
+        """
+        Sets the file position to the latest disconnect entry in the open log file.
+        Maps the file and scans it backwards in chunks, so usually only the tail is touched.
+
+        Find: if b"[flog::network] client:disconnect" in u_line:
+        """
+        fd = self.fd
         self.file_position = 0
-        file.seek(0)  # Start from the beginning
-
-        
-        while True:
-            line = file.readline()
-            if not line:
-                break  # End of file reached
-            if "[flog::network] client:disconnect" in line.lower():
-                self.file_position = file.tell()  # Update position to after this line
-            
-
-    def observe_logfile_changes(self, file: TextIOWrapper) -> list[str]:
+        size = os.fstat(fd).st_size
+        if size == 0:
+            return  # Empty files can't be mapped and have no marker anyway
+
+        try:
+            # Mapped windows are sliced straight from the page cache, no read call per chunk
+            with mmap.mmap(fd, size, access=mmap.ACCESS_READ) as mapped:
+                self.file_position = _find_last_marker_line_end(_mapped_reader(mapped), size)
+        except (OSError, ValueError):
+            # Some filesystems don't support mapping, fall back to positioned reads
+            self.file_position = _find_last_marker_line_end(lambda start, end: _read_at(fd, end - start, start), size)
+
+    def observe_logfile_changes(self) -> list[str]:
         """
-        Return the latest lines added to the log file since the last read.
+        Return the latest lines added to the open log file since the last read.
+        A line still being written is left in the file and picked up by the next read.
         """
-        file.seek(self.file_position)  # Move to the last known position
-        new_lines = []
-        for _ in range(MAX_READ_LINES):
-            line = file.readline()
-            if not line:
-                break  # No more new lines
-            new_lines.append(line)
-        self.file_position = file.tell()  # Update the position
-        filtered_lines = [line.strip() for line in new_lines if line.strip()]
-        
+        started = time.perf_counter_ns()
+        buf = self._buf
+        size = _read_into(self.fd, buf, self.file_position)  # Read from the last known position
+
+        end = buf.rfind(b"\n", 0, size) + 1
+        if end == 0 and size == MAX_READ_BYTES:
+            end = size  # A single line longer than the read size, take it as is
+        self.file_position += end  # Update the position
+
+        # Decode straight from the buffer, only the complete lines are turned into a string
+        with memoryview(buf) as view:
+            text = str(view[:end], "utf-8", "replace")
+        new_lines = text.split("\n")
+        filtered_lines = [stripped for line in new_lines if (stripped := line.strip())]  # Strip each line once
+
         # Update debug stats
-        self.total_reads += 1
-        self.total_lines_read += len(filtered_lines)
-        if not filtered_lines:
-            self.empty_reads += 1
-        
+        stats = self._stats
+        line_count = len(filtered_lines)
+        stats[0] += 1
+        stats[1] += line_count
+        stats[2] += line_count == 0
+        stats[3] += time.perf_counter_ns() - started
+
         return filtered_lines  # Return non-empty lines
-        
\ No newline at end of file
+
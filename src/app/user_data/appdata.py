@@ -10,7 +10,7 @@ import platform
 PLATFORM = platform.system().lower()
 HOME = os.path.expanduser('~')
 
-def get_user_data_directory() -> str:
+def _compute_user_data_directory() -> str:
     """
     Get the path to the user data directory based on the operating system.
     """
@@ -26,16 +26,70 @@ def get_user_data_directory() -> str:
         base = os.getenv("XDG_DATA_HOME") or os.path.join(HOME, ".local", "share")
         return os.path.join(base, "franktorio-research-scanner")
 
+# Resolved once at import, the environment it is derived from doesn't change while the app runs
+_USER_DATA_DIR = _compute_user_data_directory()
+
+def get_user_data_directory() -> str:
+    """
+    Get the path to the user data directory.
+    """
+    return _USER_DATA_DIR
+
+_CONFIG_PATH = os.path.join(_USER_DATA_DIR, 'config.json')
+
+def _config_path() -> str:
+    """
+    Get the path to the configuration file.
+    """
+    return _CONFIG_PATH
+
+# Parsed config, reused until the file's mtime or size changes
+_config_cache = {"key": None, "data": {}}
+
+def _load_config() -> dict:
+    """
+    Load the configuration file, parsing it again only if it changed since the last load.
+    Returns a copy, so callers can't change the cached data.
+    """
+    config_file_path = _config_path()
+    try:
+        st = os.stat(config_file_path)
+    except FileNotFoundError:
+        return {}
+    
+    cache_key = (st.st_mtime_ns, st.st_size)
+    if _config_cache["key"] == cache_key:
+        return dict(_config_cache["data"])
+    
+    # One open, one fstat and one read, the key is taken from the same handle the data is read from
+    try:
+        fd = os.open(config_file_path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+        try:
+            st = os.fstat(fd)
+            raw = os.read(fd, st.st_size)
+        finally:
+            os.close(fd)
+        config_data = json.loads(raw)
+    except (OSError, ValueError):
+        return {}
+    
+    cache_key = (st.st_mtime_ns, st.st_size)
+    _config_cache["key"] = cache_key
+    _config_cache["data"] = config_data
+    return dict(config_data)
+
 def create_json_config_file(file_path: str, default_data: dict) -> None:
     """
     Create a JSON configuration file with default data if it does not exist.
     """
     
-    # Exit if file already exists
-    if os.path.isfile(file_path):
+    # Create the file only if it doesn't exist yet, in one atomic step
+    try:
+        fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0), 0o644)
+    except FileExistsError:
         return
     
-    with open(file_path, 'w', encoding='utf-8') as f:
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
         json.dump(default_data, f, indent=4)
 
 def setup_user_data() -> None:
@@ -45,7 +99,7 @@ def setup_user_data() -> None:
     user_data_dir = get_user_data_directory()
     os.makedirs(user_data_dir, exist_ok=True)
     
-    config_file_path = os.path.join(user_data_dir, 'config.json')
+    config_file_path = _config_path()
     default_config = {
         "set_log_path": "", # User-defined log file path
     }
@@ -56,31 +110,25 @@ def get_value_from_config(key: str, default: any = None) -> any:
     """
     Retrieve a value from the configuration file.
     """
-    user_data_dir = get_user_data_directory()
-    config_file_path = os.path.join(user_data_dir, 'config.json')
-    
-    try:
-        with open(config_file_path, 'r', encoding='utf-8') as f:
-            config_data = json.load(f)
-            return config_data.get(key, default)
-    except (FileNotFoundError, json.JSONDecodeError):
-        return default
+    return _load_config().get(key, default)
     
 def set_value_in_config(key: str, value: any) -> None:
     """
     Set a value in the configuration file.
     """
-    user_data_dir = get_user_data_directory()
-    config_file_path = os.path.join(user_data_dir, 'config.json')
-    
-    config_data = {}
-    try:
-        with open(config_file_path, 'r', encoding='utf-8') as f:
-            config_data = json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
-        pass
+    config_file_path = _config_path()
     
+    config_data = _load_config()
     config_data[key] = value
     
-    with open(config_file_path, 'w', encoding='utf-8') as f:
-        json.dump(config_data, f, indent=4)
\ No newline at end of file
+    # Serialize once and swap the file in atomically, a crash mid-write can't leave a truncated config
+    serialized = json.dumps(config_data, indent=4)
+    tmp_file_path = config_file_path + '.tmp'
+    with open(tmp_file_path, 'w', encoding='utf-8') as f:
+        f.write(serialized)
+    os.replace(tmp_file_path, config_file_path)
+    
+    # Remember what was just written, a rewrite within the filesystem's timestamp resolution keeps the same mtime
+    st = os.stat(config_file_path)
+    _config_cache["key"] = (st.st_mtime_ns, st.st_size)
+    _config_cache["data"] = config_data